@@ -3,17 +3,25 @@ pyvaschooldata - Python wrapper for Virginia school enrollment data.
 
 Thin rpy2 wrapper around the vaschooldata R package.
 Returns pandas DataFrames.
+
+The public functions are loaded on first access, so importing the package
+does not start R.
 """
 
-from .core import (
-    fetch_enr,
-    fetch_enr_multi,
-    tidy_enr,
-    get_available_years,
-    fetch_graduation,
-    fetch_graduation_multi,
-    get_available_grad_years,
-)
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .core import (
+        fetch_enr,
+        fetch_enr_multi,
+        tidy_enr,
+        get_available_years,
+        fetch_graduation,
+        fetch_graduation_multi,
+        get_available_grad_years,
+        clear_cache,
+        LazyEnrFrame,
+    )
 
 __version__ = "0.1.0"
 __all__ = [
@@ -24,4 +32,21 @@ __all__ = [
     "fetch_graduation",
     "fetch_graduation_multi",
     "get_available_grad_years",
+    "clear_cache",
+    "LazyEnrFrame",
 ]
+
+
+def __getattr__(name):
+    """Import public names from .core on first access (PEP 562)."""
+    if name in __all__:
+        from . import core
+
+        value = getattr(core, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
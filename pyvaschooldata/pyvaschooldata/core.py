@@ -2,25 +2,525 @@
 Core functions wrapping vaschooldata R package via rpy2.
 """
 
+import functools
+import multiprocessing
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from types import MappingProxyType
+from typing import Mapping, Optional, Union
+
+import numpy as np
 import pandas as pd
-from rpy2 import robjects
-from rpy2.robjects import pandas2ri
-from rpy2.robjects.conversion import localconverter
-from rpy2.robjects.packages import importr
-
-# Import the R package (lazy load)
-_pkg = None
+import platformdirs
+import pyarrow as pa
+from pandas.api.types import union_categoricals
+
+# R package and its pre-resolved function handles (bound by _get_pkg)
+_VASD = None
+_FETCH_ENR = None
+_FETCH_ENR_MULTI = None
+_FETCH_GRAD = None
+_FETCH_GRAD_MULTI = None
+_AVAIL = None
+_AVAIL_GRAD = None
+
+# Transfer mode chosen by _transfer_mode (detected once)
+_detected_mode = None
+
+# Parquet cache of converted per-year results
+_CACHE_DIR = Path(platformdirs.user_cache_dir("pyvaschooldata"))
+
+# R's NA_integer_ as seen in a 32-bit integer buffer
+_NA_INTEGER = np.iinfo(np.int32).min
+
+# Columns shrunk by _postprocess
+_COUNT_COLUMNS = [
+    "n_students",
+    "cohort_size", "total_graduates", "diploma_count",
+    "dropouts", "still_enrolled", "long_term_absence",
+]
+_CATEGORY_COLUMNS = [
+    "type", "grade_level", "subgroup",
+    "district_name", "campus_name", "county",
+    "division_name", "school_name", "rate_type", "diploma_type",
+]
+
+# Column layout used by tidy_enr (mirrors vaschooldata::tidy_enr)
+_TIDY_INVARIANTS = [
+    "end_year", "type",
+    "district_id", "campus_id",
+    "district_name", "campus_name",
+    "county", "charter_flag",
+]
+_TIDY_SUBGROUPS = [
+    "white", "black", "hispanic", "asian",
+    "native_american", "pacific_islander", "multiracial",
+    "male", "female",
+]
+_GRADE_LEVEL_MAP = {
+    "grade_pk": "PK",
+    "grade_k": "K",
+    "grade_01": "01",
+    "grade_02": "02",
+    "grade_03": "03",
+    "grade_04": "04",
+    "grade_05": "05",
+    "grade_06": "06",
+    "grade_07": "07",
+    "grade_08": "08",
+    "grade_09": "09",
+    "grade_10": "10",
+    "grade_11": "11",
+    "grade_12": "12",
+    "grade_ug": "UG",
+}
 
 
 def _get_pkg():
-    """Lazy load the R package."""
-    global _pkg
-    if _pkg is None:
-        _pkg = importr("vaschooldata")
-    return _pkg
+    """
+    Lazy load the R package and resolve the functions this module calls.
+
+    rpy2, and with it the embedded R session, is first imported here, so
+    this module can be imported without R installed. The R functions are
+    looked up once and then called directly.
+    """
+    global _VASD, _FETCH_ENR, _FETCH_ENR_MULTI, _FETCH_GRAD
+    global _FETCH_GRAD_MULTI, _AVAIL, _AVAIL_GRAD
+    if _VASD is None:
+        from rpy2.robjects.packages import importr
+
+        vasd = importr("vaschooldata")
+        _FETCH_ENR = vasd.fetch_enr
+        _FETCH_ENR_MULTI = vasd.fetch_enr_multi
+        _FETCH_GRAD = vasd.fetch_graduation
+        _FETCH_GRAD_MULTI = vasd.fetch_graduation_multi
+        _AVAIL = vasd.get_available_years
+        _AVAIL_GRAD = vasd.get_available_grad_years
+        _VASD = vasd
+    return _VASD
+
+
+def _transfer_mode() -> str:
+    """
+    Choose how R data frames are transferred to pandas.
+
+    Returns ``"arrow"`` when ``rpy2_arrow`` can be loaded, ``"parquet"`` when
+    pyarrow and the R ``arrow`` package are both installed, and ``"rpy2"``
+    otherwise. The detection runs once per session. Setting the
+    ``VASCHOOLDATA_USE_ARROW`` environment variable to ``0`` always selects
+    ``"rpy2"``.
+    """
+    global _detected_mode
+    if os.environ.get("VASCHOOLDATA_USE_ARROW", "1") == "0":
+        return "rpy2"
+    if _detected_mode is None:
+        _detected_mode = _detect_transfer_mode()
+    return _detected_mode
+
+
+def _detect_transfer_mode() -> str:
+    """Probe for rpy2-arrow, then for pyarrow plus the R arrow package."""
+    try:
+        import rpy2_arrow.arrow  # noqa: F401
+    except (ImportError, ValueError):
+        # ValueError: the R arrow package is too old for rpy2-arrow
+        pass
+    else:
+        return "arrow"
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return "rpy2"
+    from rpy2 import robjects
+
+    if robjects.r('requireNamespace("arrow", quietly = TRUE)')[0]:
+        return "parquet"
+    return "rpy2"
+
+
+def _fetch_via_parquet(r_df) -> pd.DataFrame:
+    """
+    Convert an R data.frame to pandas through a temporary Parquet file.
+
+    R writes the frame with ``arrow::write_parquet()`` and pandas reads it
+    back with pyarrow, so no column is converted element by element.
+    """
+    from rpy2 import robjects
+
+    fd, path = tempfile.mkstemp(suffix=".parquet")
+    os.close(fd)
+    try:
+        robjects.r("arrow::write_parquet")(r_df, path)
+        return pd.read_parquet(path, engine="pyarrow")
+    finally:
+        os.unlink(path)
+
+
+def _convert_r_column(r_col):
+    """
+    Convert a single low-level R column to a NumPy array or pandas array.
+
+    Works on ``rpy2.rinterface`` vectors, skipping the ``robjects``
+    wrappers. Plain double, integer and logical vectors are copied out of
+    R in one bulk copy through the NumPy array interface, so the result
+    owns its memory and stays valid after R frees the vector. Factors are
+    rebuilt from their integer codes and levels, and character vectors are
+    read in bulk. Anything else (dates, other classed vectors) goes
+    through the pandas2ri converter.
+    """
+    from rpy2 import rinterface, robjects
+    from rpy2.robjects import pandas2ri
+    from rpy2.robjects.conversion import localconverter
+
+    rtype = r_col.typeof
+    rclass = tuple(r_col.rclass)
+    if rtype == rinterface.RTYPES.INTSXP and "factor" in rclass:
+        codes = np.asarray(r_col, dtype=np.int32)
+        # R factor codes are 1-based; NA becomes pandas' -1 code
+        codes = np.where(codes == _NA_INTEGER, -1, codes - 1)
+        levels = list(r_col.do_slot("levels"))
+        return pd.Categorical.from_codes(codes, categories=levels)
+    if rtype == rinterface.RTYPES.REALSXP and rclass == ("numeric",):
+        # NA_real_ is a NaN, so no masking is needed
+        return np.array(r_col, dtype=np.float64)
+    if rtype == rinterface.RTYPES.INTSXP and rclass == ("integer",):
+        values = np.array(r_col, dtype=np.int32)
+        mask = values == _NA_INTEGER
+        if mask.any():
+            return pd.arrays.IntegerArray(values, mask)
+        return values
+    if rtype == rinterface.RTYPES.LGLSXP and rclass == ("logical",):
+        # R stores logicals as 32-bit integers
+        values = np.asarray(r_col, dtype=np.int32)
+        mask = values == _NA_INTEGER
+        if mask.any():
+            return pd.arrays.BooleanArray(values != 0, mask)
+        return values != 0
+    if rtype == rinterface.RTYPES.STRSXP and rclass == ("character",):
+        values = np.array(list(r_col), dtype=object)
+        is_na = rinterface.baseenv["is.na"](r_col)
+        values[np.asarray(is_na, dtype=np.int32) != 0] = None
+        return values
+    with localconverter(robjects.default_converter + pandas2ri.converter) as cv:
+        return cv.rpy2py(r_col)
+
+
+def _rdf_to_pandas(r_df) -> pd.DataFrame:
+    """
+    Convert an R data.frame to pandas one column at a time.
+
+    Accepts an ``robjects`` DataFrame or a raw ``rinterface`` list vector.
+    Columns are pulled out as low-level vectors with R's ``[[`` and each
+    is converted by type with _convert_r_column(), rather than going
+    through ``pandas2ri.rpy2py`` and the high-level wrappers.
+    """
+    from rpy2 import rinterface
+
+    extract = rinterface.baseenv["[["]
+    columns = {
+        name: _convert_r_column(extract(r_df, i + 1))
+        for i, name in enumerate(r_df.names)
+    }
+    return pd.DataFrame(columns, copy=False)
+
+
+def _to_pandas(r_df) -> pd.DataFrame:
+    """
+    Convert an R data.frame to a pandas DataFrame.
+
+    With rpy2-arrow the columns cross the R/Python boundary as Arrow
+    buffers via the C Data Interface. Without it, a Parquet file is used
+    when the R ``arrow`` package is available, and converting the columns
+    through rpy2 with _rdf_to_pandas() is the last resort.
+    """
+    if isinstance(r_df, pd.DataFrame):
+        return r_df
+    mode = _transfer_mode()
+    if mode == "arrow":
+        import rpy2_arrow.arrow as pyra
+        from rpy2 import robjects
+
+        r_table = robjects.r("arrow::as_arrow_table")(r_df)
+        table = pyra.rarrow_to_py_table(r_table)
+        return table.to_pandas(split_blocks=True, self_destruct=True)
+    if mode == "parquet":
+        return _fetch_via_parquet(r_df)
+    return _rdf_to_pandas(r_df)
+
+
+def _downcast_count(col: pd.Series) -> pd.Series:
+    """Store a whole-number column as 32-bit integers."""
+    if not pd.api.types.is_numeric_dtype(col):
+        return col
+    valid = col.dropna()
+    if not np.isfinite(valid).all() or (valid % 1 != 0).any():
+        return col
+    # Values beyond int32 would silently wrap
+    if len(valid) and valid.abs().max() > np.iinfo(np.int32).max:
+        return col
+    # int32 rather than the smallest type, so sums and differences of
+    # typical counts stay well within range
+    if len(valid) == len(col):
+        return col.astype("int32")
+    return col.astype("Int32")
+
+
+def _postprocess_column(name: str, col: pd.Series) -> pd.Series:
+    """Return ``col`` in the compact dtype _postprocess uses for ``name``."""
+    if name == "end_year":
+        return col.astype("int16") if col.notna().all() else col
+    # Wide enrollment data keeps its counts in subgroup and grade columns
+    if (
+        name in _COUNT_COLUMNS
+        or name == "row_total"
+        or name in _TIDY_SUBGROUPS
+        or name in _GRADE_LEVEL_MAP
+    ):
+        return _downcast_count(col)
+    if name in _CATEGORY_COLUMNS and not isinstance(col.dtype, pd.CategoricalDtype):
+        return col.astype("category")
+    return col
+
+
+def _postprocess(df: pd.DataFrame, downcast: bool = True) -> pd.DataFrame:
+    """
+    Shrink the memory footprint of a DataFrame returned from R.
+
+    R integers with NA and R character vectors arrive as float64 and
+    object columns; compact dtypes make the frame smaller and faster to
+    work with.
+    """
+    if not downcast:
+        return df
+    for name in df.columns:
+        col = df[name]
+        new_col = _postprocess_column(name, col)
+        if new_col is not col:
+            df[name] = new_col
+    return df
+
+
+def _concat_frames(parts: list[pd.DataFrame]) -> pd.DataFrame:
+    """
+    Stack DataFrames with the same columns, one column at a time.
+
+    Each NumPy column is copied into a single pre-sized array, and
+    categorical columns are merged with ``union_categoricals``, so no
+    intermediate block managers are built. Frames whose columns differ
+    fall back to ``pd.concat``.
+    """
+    first = parts[0]
+    if any(not p.columns.equals(first.columns) for p in parts[1:]):
+        return pd.concat(parts, ignore_index=True)
+
+    total = sum(len(p) for p in parts)
+    columns = {}
+    for col in first.columns:
+        pieces = [p[col] for p in parts]
+        dtypes = [piece.dtype for piece in pieces]
+        if all(isinstance(d, pd.CategoricalDtype) for d in dtypes) and all(
+            d.categories.dtype == dtypes[0].categories.dtype for d in dtypes
+        ):
+            # union_categoricals needs the categories to share a dtype; an
+            # all-NA year has float categories and goes through pd.concat
+            columns[col] = union_categoricals(pieces)
+        elif isinstance(dtypes[0], np.dtype) and all(d == dtypes[0] for d in dtypes):
+            out = np.empty(total, dtype=dtypes[0])
+            np.concatenate([piece.to_numpy() for piece in pieces], out=out)
+            columns[col] = out
+        else:
+            # Mixed or extension dtypes: let pandas reconcile them
+            columns[col] = pd.concat(pieces, ignore_index=True)
+    return pd.DataFrame(columns, copy=False)
+
 
+def _validate_years(end_years: list[int], available: Mapping[str, int]) -> None:
+    """
+    Check requested years against the available range before calling R.
 
-def fetch_enr(end_year: int) -> pd.DataFrame:
+    Raises ValueError for any year outside ``available``, which is much
+    cheaper than letting the R function fail and translating its error.
+    """
+    min_year, max_year = available["min_year"], available["max_year"]
+    invalid = [y for y in end_years if not min_year <= y <= max_year]
+    if invalid:
+        raise ValueError(
+            f"end_year must be between {min_year} and {max_year}. "
+            f"Got: {', '.join(str(y) for y in invalid)}"
+        )
+
+
+@functools.lru_cache(maxsize=1)
+def _r_pkg_version() -> str:
+    """Installed version of the vaschooldata R package."""
+    from rpy2 import robjects
+
+    _get_pkg()
+    return robjects.r('as.character(utils::packageVersion("vaschooldata"))')[0]
+
+
+def _disk_cached(prefix: str):
+    """
+    Cache a per-year fetch on disk as Parquet, keyed by the R package
+    version, the year and any further positional arguments.
+
+    Published years do not change, so a cached file is reused across
+    sessions until the R package is upgraded. The most recent available
+    year is never cached because VDOE may still revise it.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(end_year: int, *args) -> pd.DataFrame:
+            if end_year >= get_available_years()["max_year"]:
+                return func(end_year, *args)
+            key = "_".join(
+                [prefix, _r_pkg_version(), str(end_year), *map(str, args)]
+            )
+            path = _CACHE_DIR / f"{key}.parquet"
+            if path.exists():
+                try:
+                    return pd.read_parquet(path)
+                except (OSError, pa.ArrowException):
+                    # Corrupt or unreadable cache file: drop it and refetch
+                    path.unlink(missing_ok=True)
+            df = func(end_year, *args)
+            # The cache is only an optimisation, so a failed write still
+            # returns the data
+            tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                # Write then rename so readers never see a partial file
+                df.to_parquet(tmp_path, compression="zstd", index=False)
+                os.replace(tmp_path, path)
+            except (OSError, pa.ArrowException):
+                try:
+                    tmp_path.unlink(missing_ok=True)
+                except OSError:
+                    pass
+            return df
+        return wrapper
+    return decorator
+
+
+def clear_cache() -> None:
+    """
+    Remove cached enrollment data from the local disk cache.
+
+    This only clears the Python-side Parquet cache; the R package keeps
+    its own cache, see ``vaschooldata::clear_cache()``.
+
+    Examples
+    --------
+    >>> import pyvaschooldata as va
+    >>> va.clear_cache()
+    """
+    if _CACHE_DIR.exists():
+        for pattern in ("*.parquet", "*.tmp"):
+            for path in _CACHE_DIR.glob(pattern):
+                path.unlink()
+
+
+def _check_layout(layout: str) -> None:
+    """Raise ValueError for an unknown enrollment layout."""
+    if layout not in ("long", "wide"):
+        raise ValueError(f"layout must be 'long' or 'wide'. Got: {layout!r}")
+
+
+@_disk_cached("enr")
+def _fetch_enr_frame(end_year: int, layout: str) -> pd.DataFrame:
+    """Fetch one year of enrollment data from R, before post-processing."""
+    _get_pkg()
+    return _to_pandas(_FETCH_ENR(end_year, tidy=layout == "long"))
+
+
+class LazyEnrFrame:
+    """
+    Enrollment data that converts columns from R only when they are used.
+
+    Returned by ``fetch_enr(..., lazy=True)``. The R data.frame stays in R
+    and each column is converted to a pandas Series the first time it is
+    accessed, then kept. Column names, length and membership are answered
+    from R metadata without converting anything. Call ``to_pandas()`` for
+    a regular DataFrame.
+
+    Examples
+    --------
+    >>> import pyvaschooldata as va
+    >>> enr = va.fetch_enr(2025, lazy=True)
+    >>> enr["n_students"].sum()
+    >>> df = enr.to_pandas()
+    """
+
+    def __init__(self, r_df, downcast: bool = True):
+        from rpy2 import rinterface
+
+        self._r_df = r_df
+        self._downcast = downcast
+        self._names = [str(name) for name in r_df.names]
+        self._nrow = int(rinterface.baseenv["nrow"](r_df)[0])
+        self._materialized: dict[str, pd.Series] = {}
+
+    @property
+    def columns(self) -> pd.Index:
+        """Column names, read from R without converting any data."""
+        return pd.Index(self._names)
+
+    def __len__(self) -> int:
+        return self._nrow
+
+    def __contains__(self, name) -> bool:
+        return name in self._names
+
+    def __repr__(self) -> str:
+        return (
+            f"<LazyEnrFrame: {self._nrow} rows x {len(self._names)} columns, "
+            f"{len(self._materialized)} materialized>"
+        )
+
+    def _column(self, name: str) -> pd.Series:
+        """Convert one column from R, or return it if already converted."""
+        if name not in self._materialized:
+            if name not in self._names:
+                raise KeyError(name)
+            from rpy2 import rinterface
+
+            r_col = rinterface.baseenv["[["](self._r_df, self._names.index(name) + 1)
+            # _convert_r_column returns arrays that own their memory, so the
+            # Series stays valid after this frame and its R object are freed
+            col = pd.Series(_convert_r_column(r_col), name=name, copy=False)
+            if self._downcast:
+                col = _postprocess_column(name, col)
+            self._materialized[name] = col
+        return self._materialized[name]
+
+    def __getitem__(self, key):
+        """
+        Select a column (Series) or a list of columns (DataFrame).
+
+        Any other key, such as a boolean mask, is applied to the fully
+        materialized DataFrame.
+        """
+        if isinstance(key, str):
+            return self._column(key)
+        if isinstance(key, list) and all(isinstance(k, str) for k in key):
+            return pd.DataFrame({k: self._column(k) for k in key}, copy=False)
+        return self.to_pandas()[key]
+
+    def to_pandas(self) -> pd.DataFrame:
+        """Materialize every column and return a pandas DataFrame."""
+        return pd.DataFrame(
+            {name: self._column(name) for name in self._names}, copy=False
+        )
+
+
+def fetch_enr(
+    end_year: int,
+    layout: str = "long",
+    downcast: bool = True,
+    lazy: bool = False,
+) -> Union[pd.DataFrame, LazyEnrFrame]:
     """
     Fetch Virginia school enrollment data for a single year.
 
@@ -28,28 +528,55 @@ def fetch_enr(end_year: int) -> pd.DataFrame:
     ----------
     end_year : int
         The ending year of the school year (e.g., 2025 for 2024-25).
+    layout : {"long", "wide"}, default "long"
+        ``"long"`` returns tidy data with one row per subgroup and grade
+        level. ``"wide"`` returns the R package's wide output unmelted, with
+        one column per subgroup and grade; selecting a subgroup is then a
+        column lookup instead of a filter over every row.
+    downcast : bool, default True
+        Shrink the returned columns: ``end_year`` to int16, whole-number
+        counts to int32 (nullable ``Int32`` when NA is present), and
+        repeated labels such as names and subgroups to ``category``.
+    lazy : bool, default False
+        Return a ``LazyEnrFrame`` that converts each column from R only
+        when it is accessed, instead of converting the whole frame up
+        front. Lazy results bypass the disk cache.
 
     Returns
     -------
-    pd.DataFrame
+    pd.DataFrame or LazyEnrFrame
         Enrollment data with columns for school/district identifiers,
-        enrollment counts, and demographic breakdowns.
+        enrollment counts, and demographic breakdowns. Past years are
+        cached on disk after the first fetch; see ``clear_cache``.
+
+    Raises
+    ------
+    ValueError
+        If ``end_year`` is outside the available range or ``layout`` is
+        not recognised.
 
     Examples
     --------
     >>> import pyvaschooldata as va
     >>> df = va.fetch_enr(2025)
     >>> df.head()
+    >>> wide = va.fetch_enr(2025, layout="wide")
+    >>> wide["hispanic"].sum()
     """
-    pkg = _get_pkg()
-    with localconverter(robjects.default_converter + pandas2ri.converter):
-        r_df = pkg.fetch_enr(end_year)
-        if isinstance(r_df, pd.DataFrame):
-            return r_df
-        return pandas2ri.rpy2py(r_df)
-
-
-def fetch_enr_multi(end_years: list[int]) -> pd.DataFrame:
+    _check_layout(layout)
+    _validate_years([end_year], get_available_years())
+    if lazy:
+        _get_pkg()
+        return LazyEnrFrame(_FETCH_ENR(end_year, tidy=layout == "long"), downcast)
+    return _postprocess(_fetch_enr_frame(end_year, layout), downcast)
+
+
+def fetch_enr_multi(
+    end_years: list[int],
+    max_workers: Optional[int] = None,
+    layout: str = "long",
+    downcast: bool = True,
+) -> pd.DataFrame:
     """
     Fetch Virginia school enrollment data for multiple years.
 
@@ -57,34 +584,82 @@ def fetch_enr_multi(end_years: list[int]) -> pd.DataFrame:
     ----------
     end_years : list[int]
         List of ending years (e.g., [2020, 2021, 2022]).
+    max_workers : int, optional
+        If greater than 1, fetch years in parallel using up to this many
+        worker processes, each with its own R session. By default all years
+        are fetched in a single R call. Requests for two or fewer years are
+        always fetched serially, since starting the workers costs more than
+        it saves. Workers are started with the "spawn" method, which
+        re-imports the calling script's ``__main__`` module; scripts must
+        therefore guard their top-level code with
+        ``if __name__ == "__main__":`` or the workers raise RuntimeError.
+    layout : {"long", "wide"}, default "long"
+        ``"long"`` returns tidy data with one row per subgroup and grade
+        level. ``"wide"`` returns the R package's wide output unmelted, with
+        one column per subgroup and grade; selecting a subgroup is then a
+        column lookup instead of a filter over every row.
+    downcast : bool, default True
+        Shrink the returned columns: ``end_year`` to int16, whole-number
+        counts to int32 (nullable ``Int32`` when NA is present), and
+        repeated labels such as names and subgroups to ``category``.
 
     Returns
     -------
     pd.DataFrame
         Combined enrollment data for all requested years.
 
+    Raises
+    ------
+    ValueError
+        If ``end_years`` is empty or contains a year outside the
+        available range, or ``layout`` is not recognised.
+
     Examples
     --------
     >>> import pyvaschooldata as va
     >>> df = va.fetch_enr_multi([2020, 2021, 2022])
+    >>> df = va.fetch_enr_multi(range(2016, 2026), max_workers=4)
     """
-    pkg = _get_pkg()
-    with localconverter(robjects.default_converter + pandas2ri.converter):
+    end_years = list(end_years)
+    if not end_years:
+        raise ValueError("end_years must contain at least one year")
+    _check_layout(layout)
+    _validate_years(end_years, get_available_years())
+    if max_workers is None or max_workers <= 1 or len(end_years) <= 2:
+        # A single R call fetches and binds all years on the R side
+        from rpy2 import robjects
+
+        _get_pkg()
         r_years = robjects.IntVector(end_years)
-        r_df = pkg.fetch_enr_multi(r_years)
-        if isinstance(r_df, pd.DataFrame):
-            return r_df
-        return pandas2ri.rpy2py(r_df)
+        r_df = _FETCH_ENR_MULTI(r_years, tidy=layout == "long")
+        return _postprocess(_to_pandas(r_df), downcast)
+
+    # R is not thread-safe, so each worker process runs its own R session.
+    # "spawn" avoids forking a process that already has R embedded.
+    workers = min(len(end_years), max_workers, os.cpu_count() or 1)
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_get_pkg,
+    ) as pool:
+        # Downcast once after combining so categories cover every year
+        fetch_year = functools.partial(fetch_enr, layout=layout, downcast=False)
+        parts = list(pool.map(fetch_year, end_years))
+    return _postprocess(_concat_frames(parts), downcast)
 
 
 def tidy_enr(df: pd.DataFrame) -> pd.DataFrame:
     """
     Convert enrollment data to tidy (long) format.
 
+    This is a pandas port of ``vaschooldata::tidy_enr``: each subgroup and
+    grade column is melted into ``subgroup``/``grade_level`` rows without a
+    round trip through R.
+
     Parameters
     ----------
     df : pd.DataFrame
-        Enrollment data from fetch_enr or fetch_enr_multi.
+        Wide enrollment data from fetch_enr or fetch_enr_multi.
 
     Returns
     -------
@@ -94,26 +669,123 @@ def tidy_enr(df: pd.DataFrame) -> pd.DataFrame:
     Examples
     --------
     >>> import pyvaschooldata as va
-    >>> df = va.fetch_enr(2025)
+    >>> df = va.fetch_enr(2025, layout="wide")
     >>> tidy = va.tidy_enr(df)
     """
-    pkg = _get_pkg()
-    with localconverter(robjects.default_converter + pandas2ri.converter):
-        r_df = pandas2ri.py2rpy(df)
-        r_result = pkg.tidy_enr(r_df)
-        if isinstance(r_result, pd.DataFrame):
-            return r_result
-        return pandas2ri.rpy2py(r_result)
-
-
-def get_available_years() -> dict:
+    invariants = [c for c in _TIDY_INVARIANTS if c in df.columns]
+    subgroup_cols = [c for c in _TIDY_SUBGROUPS if c in df.columns]
+    grade_cols = [c for c in df.columns if c.startswith("grade_")]
+    out_cols = invariants + ["grade_level", "subgroup", "n_students", "pct"]
+
+    parts = []
+
+    # Total enrollment as a "subgroup"
+    if "row_total" in df.columns:
+        parts.append(
+            df[invariants].assign(
+                grade_level="TOTAL",
+                subgroup="total_enrollment",
+                n_students=df["row_total"],
+                pct=1.0,
+            )
+        )
+
+    # Demographic/sex subgroups
+    if subgroup_cols:
+        long = df.melt(
+            id_vars=invariants + ["row_total"],
+            value_vars=subgroup_cols,
+            var_name="subgroup",
+            value_name="n_students",
+        )
+        long["pct"] = long["n_students"] / long["row_total"]
+        long["grade_level"] = "TOTAL"
+        parts.append(long)
+
+    # Grade-level enrollment
+    if grade_cols:
+        long = df.melt(
+            id_vars=invariants + ["row_total"],
+            value_vars=grade_cols,
+            var_name="grade_level",
+            value_name="n_students",
+        )
+        long["grade_level"] = (
+            long["grade_level"].map(_GRADE_LEVEL_MAP).fillna(long["grade_level"])
+        )
+        long["subgroup"] = "total_enrollment"
+        long["pct"] = long["n_students"] / long["row_total"]
+        parts.append(long)
+
+    if not parts:
+        return pd.DataFrame(columns=out_cols)
+
+    result = pd.concat([p[out_cols] for p in parts], ignore_index=True)
+    return result[result["n_students"].notna()].reset_index(drop=True)
+
+
+def _parse_year_range(r_result) -> dict:
+    """Extract ``min_year``/``max_year`` from an R year lookup result."""
+    # Handle different result types from rpy2
+    if isinstance(r_result, np.ndarray):
+        # Plain integer vector of available years
+        return {
+            "min_year": int(r_result.min()),
+            "max_year": int(r_result.max()),
+        }
+    elif isinstance(r_result, dict):
+        return {
+            "min_year": int(r_result["min_year"]),
+            "max_year": int(r_result["max_year"]),
+        }
+    elif hasattr(r_result, "rx2"):
+        # R vector with rx2 access
+        return {
+            "min_year": int(r_result.rx2("min_year")[0]),
+            "max_year": int(r_result.rx2("max_year")[0]),
+        }
+    elif hasattr(r_result, "names"):
+        # NamedList - access by finding index from names
+        # names may be a method or property depending on rpy2 version
+        names_attr = r_result.names
+        if callable(names_attr):
+            names_attr = names_attr()
+        if names_attr is None:
+            raise ValueError("R result has no names attribute")
+        names = list(names_attr)
+        min_idx = names.index("min_year")
+        max_idx = names.index("max_year")
+        min_val = r_result[min_idx]
+        max_val = r_result[max_idx]
+        # Values may be arrays/lists - extract first element
+        if hasattr(min_val, "__getitem__") and not isinstance(min_val, (int, float, str)):
+            min_val = min_val[0]
+        if hasattr(max_val, "__getitem__") and not isinstance(max_val, (int, float, str)):
+            max_val = max_val[0]
+        return {
+            "min_year": int(min_val),
+            "max_year": int(max_val),
+        }
+    else:
+        # Last resort - try dict-like conversion
+        result_dict = dict(r_result)
+        return {
+            "min_year": int(result_dict["min_year"]),
+            "max_year": int(result_dict["max_year"]),
+        }
+
+
+@functools.lru_cache(maxsize=1)
+def get_available_years() -> Mapping[str, int]:
     """
     Get the range of available years for enrollment data.
 
+    The result is looked up in R once per session and cached.
+
     Returns
     -------
-    dict
-        Dictionary with 'min_year' and 'max_year' keys.
+    Mapping[str, int]
+        Read-only mapping with 'min_year' and 'max_year' keys.
 
     Examples
     --------
@@ -121,53 +793,17 @@ def get_available_years() -> dict:
     >>> years = va.get_available_years()
     >>> print(f"Data available from {years['min_year']} to {years['max_year']}")
     """
-    pkg = _get_pkg()
+    from rpy2 import robjects
+    from rpy2.robjects import pandas2ri
+    from rpy2.robjects.conversion import localconverter
+
+    _get_pkg()
     with localconverter(robjects.default_converter + pandas2ri.converter):
-        r_result = pkg.get_available_years()
-        # Handle different result types from rpy2
-        if isinstance(r_result, dict):
-            return {
-                "min_year": int(r_result["min_year"]),
-                "max_year": int(r_result["max_year"]),
-            }
-        elif hasattr(r_result, "rx2"):
-            # R vector with rx2 access
-            return {
-                "min_year": int(r_result.rx2("min_year")[0]),
-                "max_year": int(r_result.rx2("max_year")[0]),
-            }
-        elif hasattr(r_result, "names"):
-            # NamedList - access by finding index from names
-            # names may be a method or property depending on rpy2 version
-            names_attr = r_result.names
-            if callable(names_attr):
-                names_attr = names_attr()
-            if names_attr is None:
-                raise ValueError("R result has no names attribute")
-            names = list(names_attr)
-            min_idx = names.index("min_year")
-            max_idx = names.index("max_year")
-            min_val = r_result[min_idx]
-            max_val = r_result[max_idx]
-            # Values may be arrays/lists - extract first element
-            if hasattr(min_val, "__getitem__") and not isinstance(min_val, (int, float, str)):
-                min_val = min_val[0]
-            if hasattr(max_val, "__getitem__") and not isinstance(max_val, (int, float, str)):
-                max_val = max_val[0]
-            return {
-                "min_year": int(min_val),
-                "max_year": int(max_val),
-            }
-        else:
-            # Last resort - try dict-like conversion
-            result_dict = dict(r_result)
-            return {
-                "min_year": int(result_dict["min_year"]),
-                "max_year": int(result_dict["max_year"]),
-            }
+        r_result = _AVAIL()
+        return MappingProxyType(_parse_year_range(r_result))
 
 
-def fetch_graduation(end_year: int) -> pd.DataFrame:
+def fetch_graduation(end_year: int, downcast: bool = True) -> pd.DataFrame:
     """
     Fetch Virginia graduation rate data for a single year.
 
@@ -175,6 +811,10 @@ def fetch_graduation(end_year: int) -> pd.DataFrame:
     ----------
     end_year : int
         The ending year of the school year (e.g., 2023 for 2022-23).
+    downcast : bool, default True
+        Shrink the returned columns: ``end_year`` to int16, whole-number
+        counts to int32 (nullable ``Int32`` when NA is present), and
+        repeated labels such as names and subgroups to ``category``.
 
     Returns
     -------
@@ -182,21 +822,25 @@ def fetch_graduation(end_year: int) -> pd.DataFrame:
         Graduation rate data with columns for school/district identifiers,
         graduation rates, cohort sizes, and diploma type breakdowns.
 
+    Raises
+    ------
+    ValueError
+        If ``end_year`` is outside the available range.
+
     Examples
     --------
     >>> import pyvaschooldata as va
     >>> df = va.fetch_graduation(2023)
     >>> df.head()
     """
-    pkg = _get_pkg()
-    with localconverter(robjects.default_converter + pandas2ri.converter):
-        r_df = pkg.fetch_graduation(end_year)
-        if isinstance(r_df, pd.DataFrame):
-            return r_df
-        return pandas2ri.rpy2py(r_df)
+    _validate_years([end_year], get_available_grad_years())
+    _get_pkg()
+    return _postprocess(_to_pandas(_FETCH_GRAD(end_year)), downcast)
 
 
-def fetch_graduation_multi(end_years: list[int]) -> pd.DataFrame:
+def fetch_graduation_multi(
+    end_years: list[int], downcast: bool = True
+) -> pd.DataFrame:
     """
     Fetch Virginia graduation rate data for multiple years.
 
@@ -204,34 +848,50 @@ def fetch_graduation_multi(end_years: list[int]) -> pd.DataFrame:
     ----------
     end_years : list[int]
         List of ending years (e.g., [2020, 2021, 2022]).
+    downcast : bool, default True
+        Shrink the returned columns: ``end_year`` to int16, whole-number
+        counts to int32 (nullable ``Int32`` when NA is present), and
+        repeated labels such as names and subgroups to ``category``.
 
     Returns
     -------
     pd.DataFrame
         Combined graduation rate data for all requested years.
 
+    Raises
+    ------
+    ValueError
+        If ``end_years`` is empty or contains a year outside the
+        available range.
+
     Examples
     --------
     >>> import pyvaschooldata as va
     >>> df = va.fetch_graduation_multi([2020, 2021, 2022])
     """
-    pkg = _get_pkg()
-    with localconverter(robjects.default_converter + pandas2ri.converter):
-        r_years = robjects.IntVector(end_years)
-        r_df = pkg.fetch_graduation_multi(r_years)
-        if isinstance(r_df, pd.DataFrame):
-            return r_df
-        return pandas2ri.rpy2py(r_df)
+    end_years = list(end_years)
+    if not end_years:
+        raise ValueError("end_years must contain at least one year")
+    _validate_years(end_years, get_available_grad_years())
+    # A single R call fetches and binds all years on the R side
+    from rpy2 import robjects
+
+    _get_pkg()
+    r_years = robjects.IntVector(end_years)
+    return _postprocess(_to_pandas(_FETCH_GRAD_MULTI(r_years)), downcast)
 
 
-def get_available_grad_years() -> dict:
+@functools.lru_cache(maxsize=1)
+def get_available_grad_years() -> Mapping[str, int]:
     """
     Get the range of available years for graduation rate data.
 
+    The result is looked up in R once per session and cached.
+
     Returns
     -------
-    dict
-        Dictionary with 'min_year' and 'max_year' keys.
+    Mapping[str, int]
+        Read-only mapping with 'min_year' and 'max_year' keys.
 
     Examples
     --------
@@ -239,44 +899,17 @@ def get_available_grad_years() -> dict:
     >>> years = va.get_available_grad_years()
     >>> print(f"Graduation data available from {years['min_year']} to {years['max_year']}")
     """
-    pkg = _get_pkg()
+    from rpy2 import robjects
+    from rpy2.robjects import pandas2ri
+    from rpy2.robjects.conversion import localconverter
+
+    _get_pkg()
     with localconverter(robjects.default_converter + pandas2ri.converter):
-        r_result = pkg.get_available_grad_years()
-        # Handle different result types from rpy2
-        if isinstance(r_result, dict):
-            return {
-                "min_year": int(r_result["min_year"]),
-                "max_year": int(r_result["max_year"]),
-            }
-        elif hasattr(r_result, "rx2"):
-            # R vector with rx2 access
-            return {
-                "min_year": int(r_result.rx2("min_year")[0]),
-                "max_year": int(r_result.rx2("max_year")[0]),
-            }
-        elif hasattr(r_result, "names"):
-            # NamedList - access by finding index from names
-            names_attr = r_result.names
-            if callable(names_attr):
-                names_attr = names_attr()
-            if names_attr is None:
-                raise ValueError("R result has no names attribute")
-            names = list(names_attr)
-            min_idx = names.index("min_year")
-            max_idx = names.index("max_year")
-            min_val = r_result[min_idx]
-            max_val = r_result[max_idx]
-            if hasattr(min_val, "__getitem__") and not isinstance(min_val, (int, float, str)):
-                min_val = min_val[0]
-            if hasattr(max_val, "__getitem__") and not isinstance(max_val, (int, float, str)):
-                max_val = max_val[0]
-            return {
-                "min_year": int(min_val),
-                "max_year": int(max_val),
-            }
-        else:
-            result_dict = dict(r_result)
-            return {
-                "min_year": int(result_dict["min_year"]),
-                "max_year": int(result_dict["max_year"]),
-            }
+        r_result = _AVAIL_GRAD()
+        return MappingProxyType(_parse_year_range(r_result))
+
+
+def _invalidate_years_cache() -> None:
+    """Clear the cached results of the available-year lookups."""
+    get_available_years.cache_clear()
+    get_available_grad_years.cache_clear()
@@ -0,0 +1,52 @@
+"""
+Shared pytest fixtures for the pyvaschooldata tests.
+
+Fetching data goes through R and VDOE, so each dataset is fetched once
+per test session and shared by every test that needs it.
+"""
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def va(tmp_path_factory):
+    """
+    The pyvaschooldata package, skipping if rpy2 is not installed.
+
+    The Parquet disk cache is pointed at a temporary directory for the
+    session, so tests exercise R rather than files left by earlier runs
+    and nothing is written to the user cache directory.
+    """
+    pytest.importorskip("rpy2")
+    import pyvaschooldata
+    from pyvaschooldata import core
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(core, "_CACHE_DIR", tmp_path_factory.mktemp("cache"))
+        yield pyvaschooldata
+
+
+@pytest.fixture(scope="session")
+def years(va):
+    """Available enrollment year range."""
+    return va.get_available_years()
+
+
+@pytest.fixture(scope="session")
+def enr_2023(va):
+    """
+    2023 enrollment data, skipping if VDOE data cannot be fetched.
+
+    Availability is probed by calling the R function directly, so only
+    download failures skip; errors in the Python wrapper still fail.
+    """
+    from rpy2 import robjects
+    from rpy2.rinterface_lib.embedded import RRuntimeError
+
+    try:
+        robjects.r("vaschooldata::fetch_enr")(2023)
+    except RRuntimeError as e:
+        pytest.skip(f"VDOE data unavailable: {e}")
+    df = va.fetch_enr(2023)
+    assert len(df) > 0
+    return df
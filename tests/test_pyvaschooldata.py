@@ -1,8 +1,10 @@
 """
 Tests for pyvaschooldata Python wrapper.
 
-Minimal smoke tests - the actual data logic is tested by R testthat.
-These just verify the Python wrapper imports and exposes expected functions.
+Mostly smoke tests - the actual data logic is tested by R testthat.
+These verify the Python wrapper imports and exposes expected functions,
+plus a few checks on fetched data that share one fetch per session
+(see conftest.py).
 """
 
 import pytest
@@ -47,3 +49,305 @@ def test_has_version():
     import pyvaschooldata
     assert hasattr(pyvaschooldata, '__version__')
     assert isinstance(pyvaschooldata.__version__, str)
+
+
+def test_has_clear_cache():
+    """clear_cache function is available."""
+    import pyvaschooldata
+    assert hasattr(pyvaschooldata, 'clear_cache')
+    assert callable(pyvaschooldata.clear_cache)
+
+
+class TestGetAvailableYears:
+    """get_available_years returns a usable year range."""
+
+    def test_has_min_and_max(self, years):
+        assert years['min_year'] <= years['max_year']
+
+    def test_includes_2023(self, years):
+        assert years['min_year'] <= 2023 <= years['max_year']
+
+
+class TestFetchEnr:
+    """fetch_enr returns tidy enrollment data (fetched once per session)."""
+
+    def test_returns_dataframe(self, enr_2023):
+        import pandas as pd
+        assert isinstance(enr_2023, pd.DataFrame)
+        assert len(enr_2023) > 0
+
+    def test_end_year_is_2023(self, enr_2023):
+        assert (enr_2023['end_year'] == 2023).all()
+
+    def test_has_tidy_columns(self, enr_2023):
+        for col in ['subgroup', 'grade_level', 'n_students']:
+            assert col in enr_2023.columns
+
+    def test_n_students_numeric(self, enr_2023):
+        import pandas as pd
+        assert pd.api.types.is_numeric_dtype(enr_2023['n_students'])
+
+    def test_no_negative_counts(self, enr_2023):
+        assert (enr_2023['n_students'].dropna() >= 0).all()
+
+    def test_has_state_total(self, enr_2023):
+        total = enr_2023[
+            (enr_2023['subgroup'] == 'total_enrollment')
+            & (enr_2023['grade_level'] == 'TOTAL')
+        ]
+        assert len(total) > 0
+
+
+class TestEdgeCases:
+    """Invalid years are rejected."""
+
+    def test_year_too_early_raises(self, va):
+        with pytest.raises(ValueError):
+            va.fetch_enr(1800)
+
+    def test_year_too_late_raises(self, va):
+        with pytest.raises(ValueError):
+            va.fetch_enr(2099)
+
+    def test_empty_year_list_raises(self, va):
+        with pytest.raises(ValueError):
+            va.fetch_enr_multi([])
+
+
+class TestLazyEnrFrame:
+    """fetch_enr(lazy=True) converts columns on demand."""
+
+    @pytest.fixture(scope='class')
+    def lazy_2023(self, va, enr_2023):
+        return va.fetch_enr(2023, lazy=True)
+
+    def test_metadata_matches_eager(self, lazy_2023, enr_2023):
+        assert list(lazy_2023.columns) == list(enr_2023.columns)
+        assert len(lazy_2023) == len(enr_2023)
+        assert 'n_students' in lazy_2023
+        assert 'not_a_column' not in lazy_2023
+
+    def test_column_matches_eager(self, lazy_2023, enr_2023):
+        import pandas as pd
+        pd.testing.assert_series_equal(
+            lazy_2023['n_students'], enr_2023['n_students'], check_dtype=False
+        )
+
+    def test_list_and_mask_selection(self, lazy_2023, enr_2023):
+        subset = lazy_2023[['end_year', 'n_students']]
+        assert list(subset.columns) == ['end_year', 'n_students']
+        mask = (lazy_2023['subgroup'] == 'total_enrollment').to_numpy()
+        assert len(lazy_2023[mask]) == int(mask.sum())
+
+    def test_to_pandas_matches_eager(self, lazy_2023, enr_2023):
+        assert lazy_2023.to_pandas().shape == enr_2023.shape
+
+    def test_column_outlives_frame(self, va, enr_2023):
+        import gc
+        from rpy2 import robjects
+        col = va.fetch_enr(2023, lazy=True)['n_students']
+        gc.collect()
+        robjects.r('gc()')
+        assert col.sum() == enr_2023['n_students'].sum()
+
+
+class TestConcatFrames:
+    """_concat_frames matches pd.concat (pure pandas, no R needed)."""
+
+    def _check(self, parts, check_dtype=True):
+        import pandas as pd
+        from pyvaschooldata.core import _concat_frames
+        result = _concat_frames(parts)
+        expected = pd.concat(parts, ignore_index=True)
+        if not check_dtype:
+            result = result.astype(object)
+            expected = expected.astype(object)
+        pd.testing.assert_frame_equal(result, expected)
+        return result
+
+    def test_same_numpy_dtype(self):
+        import pandas as pd
+        result = self._check([
+            pd.DataFrame({'a': [1, 2], 'b': [0.5, 1.5]}),
+            pd.DataFrame({'a': [3], 'b': [2.5]}),
+        ])
+        assert result['a'].dtype == 'int64'
+
+    def test_categorical(self):
+        import pandas as pd
+        from pyvaschooldata.core import _concat_frames
+        parts = [
+            pd.DataFrame({'c': pd.Categorical(['x', 'y'])}),
+            pd.DataFrame({'c': pd.Categorical(['z'])}),
+        ]
+        self._check(parts, check_dtype=False)
+        # Unlike pd.concat, categories are merged rather than lost
+        result = _concat_frames(parts)
+        assert isinstance(result['c'].dtype, pd.CategoricalDtype)
+        assert list(result['c']) == ['x', 'y', 'z']
+
+    def test_categorical_with_all_na_part(self):
+        import pandas as pd
+        self._check([
+            pd.DataFrame({'c': pd.Categorical(['a'])}),
+            pd.DataFrame({'c': pd.Categorical([None])}),
+        ])
+
+    def test_mixed_dtypes(self):
+        import pandas as pd
+        self._check([
+            pd.DataFrame({'n': pd.array([1, None], dtype='Int32')}),
+            pd.DataFrame({'n': [2.5]}),
+        ])
+
+    def test_different_columns(self):
+        import pandas as pd
+        self._check([
+            pd.DataFrame({'a': [1]}),
+            pd.DataFrame({'b': [2]}),
+        ])
+
+
+class TestTidyEnr:
+    """tidy_enr matches vaschooldata::tidy_enr on real 2023 data."""
+
+    @pytest.fixture(scope='class')
+    def r_tidy(self, va, enr_2023):
+        from rpy2 import robjects
+        from pyvaschooldata import core
+        r_tidy_enr = robjects.r(
+            'function(y) vaschooldata::tidy_enr(vaschooldata::fetch_enr(y, tidy = FALSE))'
+        )
+        return core._to_pandas(r_tidy_enr(2023))
+
+    @pytest.mark.parametrize('downcast', [False, True])
+    def test_matches_r_tidy_enr(self, va, r_tidy, downcast):
+        import numpy as np
+        wide = va.fetch_enr(2023, layout='wide', downcast=downcast)
+        tidy = va.tidy_enr(wide)
+
+        assert list(tidy.columns) == list(r_tidy.columns)
+        assert len(tidy) == len(r_tidy)
+        for col in ['type', 'grade_level', 'subgroup']:
+            assert tidy[col].astype(str).tolist() == r_tidy[col].astype(str).tolist()
+        for col in ['n_students', 'pct']:
+            np.testing.assert_allclose(
+                tidy[col].to_numpy(dtype=float, na_value=np.nan),
+                r_tidy[col].to_numpy(dtype=float, na_value=np.nan),
+            )
+
+
+class TestPostprocess:
+    """Dtype downcasting of returned frames (pure pandas, no R needed)."""
+
+    def test_whole_counts_become_int32(self):
+        import pandas as pd
+        from pyvaschooldata.core import _downcast_count
+        assert _downcast_count(pd.Series([1.0, 2.0])).dtype == 'int32'
+
+    def test_counts_with_na_become_nullable(self):
+        import pandas as pd
+        from pyvaschooldata.core import _downcast_count
+        result = _downcast_count(pd.Series([1.0, None]))
+        assert result.dtype == 'Int32'
+        assert result.isna().tolist() == [False, True]
+
+    def test_fractional_values_left_alone(self):
+        import pandas as pd
+        from pyvaschooldata.core import _downcast_count
+        assert _downcast_count(pd.Series([1.5, 2.0])).dtype == 'float64'
+
+    def test_values_beyond_int32_left_alone(self):
+        import pandas as pd
+        from pyvaschooldata.core import _downcast_count
+        result = _downcast_count(pd.Series([3e10, 2.0]))
+        assert result.dtype == 'float64'
+        assert result.tolist() == [3e10, 2.0]
+
+    def test_postprocess_column_rules(self):
+        import pandas as pd
+        from pyvaschooldata.core import _postprocess_column
+        assert _postprocess_column('end_year', pd.Series([2023.0])).dtype == 'int16'
+        assert _postprocess_column('grade_k', pd.Series([3.0])).dtype == 'int32'
+        assert isinstance(
+            _postprocess_column('subgroup', pd.Series(['white'])).dtype,
+            pd.CategoricalDtype,
+        )
+        assert _postprocess_column('pct', pd.Series([0.5])).dtype == 'float64'
+
+    def test_postprocess_respects_downcast_flag(self):
+        import pandas as pd
+        from pyvaschooldata.core import _postprocess
+        df = pd.DataFrame({'end_year': [2023.0], 'n_students': [5.0]})
+        assert _postprocess(df.copy(), downcast=False).dtypes.tolist() == ['float64', 'float64']
+        result = _postprocess(df.copy())
+        assert result['end_year'].dtype == 'int16'
+        assert result['n_students'].dtype == 'int32'
+
+
+class TestFetchEnrMulti:
+    """fetch_enr_multi returns the same data serially and in parallel."""
+
+    def test_parallel_matches_single_call(self, va, enr_2023, tmp_path, monkeypatch):
+        import pandas as pd
+        # Spawned workers build their own disk cache path from the environment
+        monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path))
+        years = [2021, 2022, 2023]
+        serial = va.fetch_enr_multi(years)
+        parallel = va.fetch_enr_multi(years, max_workers=2)
+
+        assert list(parallel.columns) == list(serial.columns)
+        assert parallel.shape == serial.shape
+        pd.testing.assert_series_equal(
+            parallel.groupby('end_year')['n_students'].sum(),
+            serial.groupby('end_year')['n_students'].sum(),
+            check_dtype=False,
+        )
+
+
+class TestDiskCache:
+    """The Parquet cache never makes a fetch fail (pure Python, no R needed)."""
+
+    @pytest.fixture
+    def cached_fetch(self, monkeypatch):
+        import pandas as pd
+        from types import MappingProxyType
+        from pyvaschooldata import core
+        calls = []
+
+        def fetch(end_year):
+            calls.append(end_year)
+            return pd.DataFrame({'end_year': [end_year]})
+
+        monkeypatch.setattr(
+            core, 'get_available_years',
+            lambda: MappingProxyType({'min_year': 2016, 'max_year': 2025}),
+        )
+        monkeypatch.setattr(core, '_r_pkg_version', lambda: '0.0.0')
+        return core._disk_cached('test')(fetch), calls
+
+    def test_unwritable_cache_dir_still_returns_data(
+        self, cached_fetch, tmp_path, monkeypatch
+    ):
+        from pyvaschooldata import core
+        blocker = tmp_path / 'not_a_dir'
+        blocker.write_text('')
+        monkeypatch.setattr(core, '_CACHE_DIR', blocker / 'cache')
+        fetch, calls = cached_fetch
+        assert fetch(2020)['end_year'].tolist() == [2020]
+        assert calls == [2020]
+
+    def test_corrupt_cache_file_is_refetched(
+        self, cached_fetch, tmp_path, monkeypatch
+    ):
+        from pyvaschooldata import core
+        monkeypatch.setattr(core, '_CACHE_DIR', tmp_path)
+        fetch, calls = cached_fetch
+        fetch(2020)
+        (cache_file,) = tmp_path.glob('*.parquet')
+        cache_file.write_bytes(b'not parquet')
+        assert fetch(2020)['end_year'].tolist() == [2020]
+        assert calls == [2020, 2020]
+        assert fetch(2020)['end_year'].tolist() == [2020]
+        assert calls == [2020, 2020]
+        assert not list(tmp_path.glob('*.tmp'))